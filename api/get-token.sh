@@ -107,13 +107,14 @@ curl -s ${BASE_URL}/api/v1/auth/provider > provider_resp || cat provider_resp ||
 # }
 
 if [ "$freetrial" = 'true' ]; then
-  CLIENT_ID=$(< provider_resp jq -r .freetrialClientId)
+  client_id_key=freetrialClientId
 else
-  CLIENT_ID=$(< provider_resp jq -r .clientId)
+  client_id_key=clientId
 fi
-AUTH_SERVER=$(< provider_resp jq -r .issuerUri)
-SCOPE=$(< provider_resp jq -r .scope)
-AUDIENCE=$(< provider_resp jq -r .audience)
+# parse the provider response once, fields are joined with the unit separator so
+# empty values and backslashes are kept as they are
+IFS=$'\x1f' read -r CLIENT_ID AUTH_SERVER SCOPE AUDIENCE < <(< provider_resp jq -r --arg client_id_key "$client_id_key" \
+  '[.[$client_id_key], .issuerUri, .scope, .audience] | map(tostring) | join("\u001f")')
 
 # 2. Choose method for obtaining the token
 #   - for the first time use, follow the device code flow
@@ -136,9 +137,8 @@ function get_by_device_code()
     #   "interval": 5,
     #   "verification_uri_complete": "https://auth.biganimal.com/activate?user_code=HHHJ-MMSZ"
     # }
-    DEVICE_CODE=$(< code_resp jq -r .device_code)
-    USER_CODE=$(< code_resp jq -r .user_code)
-    VERIFICATION_URI_COMPLETE=$(< code_resp jq -r .verification_uri_complete)
+    IFS=$'\x1f' read -r DEVICE_CODE USER_CODE VERIFICATION_URI_COMPLETE < <(< code_resp jq -r \
+      '[.device_code, .user_code, .verification_uri_complete] | map(tostring) | join("\u001f")')
 
     # Guide the user to finish the AuthN flow on Web Browser
 
@@ -245,12 +245,13 @@ function print_result()
     # Always substitute the access_token with the one exchanged
     # from BigAnimal portal API
     if [ "$format" = 'json' ]; then
-        < token_resp jq ".access_token=$(< biganimal_token_resp jq .token) | del(.id_token)"
+        < token_resp jq --slurpfile biganimal_token biganimal_token_resp \
+          '.access_token=$biganimal_token[0].token | del(.id_token)'
     else
         # Parse token
-        ACCESS_TOKEN=$(< biganimal_token_resp jq -r .token)
-        REFRESH_TOKEN=$(< token_resp jq -r .refresh_token)
-        EXPIRES_IN=$(< token_resp jq -r .expires_in)
+        IFS=$'\x1f' read -r ACCESS_TOKEN REFRESH_TOKEN EXPIRES_IN < <(< token_resp jq -r \
+          --slurpfile biganimal_token biganimal_token_resp \
+          '[$biganimal_token[0].token, .refresh_token, .expires_in] | map(tostring) | join("\u001f")')
 
         echo "####### Access Token ################"
         echo $ACCESS_TOKEN